@@ -1,5 +1,4 @@
 """abstraction of khl concept channel: where messages flow in"""
-import json
 from abc import ABC, abstractmethod
 from typing import Union, List, Dict
 
@@ -10,7 +9,7 @@ from .interface import LazyLoadable
 from .permission import ChannelPermission, PermissionHolder
 from .role import Role
 from .user import User, GuildUser
-from .util import unpack_value, unpack_id
+from .util import unpack_value, unpack_id, dump_card
 
 
 class Channel(LazyLoadable, Requestable, ABC):
@@ -148,9 +147,9 @@ class PublicTextChannel(PublicChannel):
         ``temp_target_id`` is available in PublicTextChannel, so ``send()`` is overloaded here
         """
         # if content is card msg, then convert it to plain str
-        if isinstance(content, List):
+        if isinstance(content, list):
             type = MessageTypes.CARD
-            content = json.dumps(content)
+            content = dump_card(content)
         type = type if type is not None else MessageTypes.KMD
 
         # merge params
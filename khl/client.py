@@ -75,7 +75,7 @@ class Client(Requestable, AsyncRunnable):
         """
         msg = self._make_msg(pkg)
         if self.ignore_self_msg and msg.type != MessageTypes.SYS:
-            if msg.author.id == (await self.fetch_me()).id:
+            if msg.author_id == (await self.fetch_me()).id:
                 return
         self._dispatch_msg(msg)
 
@@ -1,6 +1,8 @@
+import asyncio
 from typing import Union, Callable, Coroutine, Any
 
 from khl import Message, User
+from .util import wrap_if_coro
 
 TypeRule = Callable[[Message], Union[bool, Coroutine[Any, Any, bool]]]
 
@@ -11,9 +13,16 @@ class Rule:
     @staticmethod
     def is_bot_mentioned(bot) -> TypeRule:
         """:return: a Rule that checks if the bot is mentioned"""
+        bot_id = None  # bot's id never changes, resolve it once and reuse
 
         async def rule(msg: Message) -> bool:
-            return (await bot.fetch_me()).id in msg.extra.get('mention')
+            nonlocal bot_id
+            if not getattr(msg, '_is_public', False):
+                return False
+            if bot_id is None:
+                # accepts both Bot and Client
+                bot_id = (await getattr(bot, 'client', bot).fetch_me()).id
+            return bot_id in msg.mention
 
         return rule
 
@@ -22,7 +31,7 @@ class Rule:
         """:return: a Rule that checks if the user is mentioned"""
 
         def rule(msg: Message) -> bool:
-            return user.id in msg.extra.get('mention')
+            return getattr(msg, '_is_public', False) and user.id in msg.mention
 
         return rule
 
@@ -35,3 +44,19 @@ class Rule:
     def is_not_bot(msg: Message) -> bool:
         """:return: a Rule that check if the msg belong non bot"""
         return not msg.author.bot
+
+    @staticmethod
+    def all_of(*rules: TypeRule) -> TypeRule:
+        """:return: a Rule that checks if the msg fulfills all ``rules``
+
+        sync rules are checked before async ones(order kept within each kind), and the check stops at the first
+        unfulfilled one, so cheap rules such as ``is_not_bot`` can reject a msg before ``is_bot_mentioned`` awaits"""
+        ordered = sorted(rules, key=asyncio.iscoroutinefunction)
+
+        async def rule(msg: Message) -> bool:
+            for r in ordered:
+                if not await wrap_if_coro(r(msg)):
+                    return False
+            return True
+
+        return rule
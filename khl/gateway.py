@@ -1,7 +1,7 @@
 """gateway related stuff"""
 import asyncio
 from abc import ABC
-from typing import Union, List
+from typing import Union, List, AsyncIterator
 
 from .api import _Req
 from .receiver import Receiver
@@ -33,6 +33,14 @@ class Gateway:
         """execute paged request, this is just a wrapper for convenience"""
         return await self.requester.exec_paged_req(r, **kwargs)
 
+    async def exec_paged_req_concurrent(self, r: _Req, **kwargs) -> List:
+        """execute paged request concurrently, this is just a wrapper for convenience"""
+        return await self.requester.exec_paged_req_concurrent(r, **kwargs)
+
+    def iter_paged_req(self, r: _Req, **kwargs) -> AsyncIterator:
+        """execute paged request lazily, this is just a wrapper for convenience"""
+        return self.requester.iter_paged_req(r, **kwargs)
+
     async def run(self, in_queue: asyncio.Queue):
         """run the receiver"""
         self.receiver.pkg_queue = in_queue
@@ -48,4 +56,5 @@ class Requestable(ABC):
 
         `Guild`: guild.get_roles() to fetch role list from khl
     """
+    __slots__ = ()
     gate: Gateway
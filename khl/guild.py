@@ -1,8 +1,9 @@
 """guild related stuffs: Guild, ChannelCategory"""
+import asyncio
 import logging
 import time
 import warnings
-from typing import List, Union, Dict, IO
+from typing import List, Union, Dict, IO, Iterable, Tuple, Callable, Coroutine, AsyncIterator
 
 from . import api
 from ._types import ChannelTypes, GuildMuteTypes, BadgeTypes
@@ -12,7 +13,7 @@ from .interface import LazyLoadable
 from .permission import PermissionHolder, ChannelPermission
 from .role import Role
 from .user import User, GuildUser
-from .util import unpack_id, unpack_value
+from .util import unpack_id, unpack_value, swr_cache, swr_invalidate, coalesce, forget_in_flight, intern_id
 
 log = logging.getLogger(__name__)
 
@@ -80,7 +81,7 @@ class ChannelCategory(PermissionHolder, Requestable):
         self.guild_id = kwargs.get('_guild_id_')
         self.level = kwargs.get('level')
         self.limit_amount = kwargs.get('limit_amount')
-        self._channels = kwargs.get('channels', [])
+        self._channels = list(kwargs.get('channels', []))
         self.permission: ChannelPermission = ChannelPermission(**kwargs)
 
     @property
@@ -145,6 +146,9 @@ class Guild(LazyLoadable, Requestable):
 
     represent a server where users gathered in and contains channels
     """
+    __slots__ = ('id', 'name', 'topic', 'master_id', 'icon', 'notify_type', 'region', 'enable_open', 'open_id',
+                 'default_channel_id', 'welcome_channel_id', '_roles', '_channel_categories', '_channels', '_cache',
+                 '_loaded', 'gate')
     id: str
     name: str
     topic: str
@@ -159,10 +163,12 @@ class Guild(LazyLoadable, Requestable):
     _roles: List[Role]
     _channel_categories: Dict[str, ChannelCategory]
     _channels: List[PublicChannel]
+    _cache: Dict[str, list]
 
     def __init__(self, **kwargs):
-        self.id = kwargs.get('id')
+        self.id = intern_id(kwargs.get('id'))
         self._channel_categories = {}
+        self._cache = {}
         self._loaded = kwargs.get('_lazy_loaded_', False)
         self.gate = kwargs.get('_gate_', None)
         self._update_fields(**kwargs)
@@ -170,7 +176,7 @@ class Guild(LazyLoadable, Requestable):
     def _update_fields(self, **kwargs):
         self.name = kwargs.get('name', '')
         self.topic = kwargs.get('topic', '')
-        self.master_id = kwargs.get('master_id', '')
+        self.master_id = intern_id(kwargs.get('master_id', ''))
         self.icon = kwargs.get('icon', '')
         self.notify_type = kwargs.get('notify_type', 0)
         self.region = kwargs.get('region', '')
@@ -181,37 +187,59 @@ class Guild(LazyLoadable, Requestable):
         self._roles = kwargs.get('roles', None)
         self._channels = kwargs.get('channels', None)
 
+    def _req_ident(self, resource: str) -> str:
+        # scoped by gateway: bots with different tokens may see different data of the same guild
+        return f'{id(self.gate)}:guild:{self.id}:{resource}'
+
+    def _invalidate(self, method: str, resource: str):
+        """drop the result cached by ``method``, and let the next fetch of ``resource`` send a new req"""
+        swr_invalidate(self, method)
+        forget_in_flight(self._req_ident(resource))
+
+    @swr_cache()
     async def load(self):
-        self._update_fields(**(await self.gate.exec_req(api.Guild.view(self.id))))
+        """load guild info from khl server, cached, pass ``force_update=True`` to skip the cache"""
+        raw = await coalesce(self._req_ident('view'), lambda: self.gate.exec_req(api.Guild.view(self.id)))
+        self._update_fields(**raw)
         self._loaded = True
 
-    async def fetch_channel_category_list(self, force_update: bool = True) -> List[ChannelCategory]:
+    async def fetch_channel_category_list(self, force_update: bool = False) -> List[ChannelCategory]:
         """fetch all channel category as a list"""
-        await self.fetch_channel_list(force_update)
+        # force_update is added by @swr_cache, which pylint can not see through
+        await self.fetch_channel_list(force_update=force_update)  # pylint: disable=unexpected-keyword-arg
         return list(self._channel_categories.values())
 
-    async def fetch_channel_list(self, force_update: bool = True) -> List[PublicChannel]:
-        """fetch channel list from khl server"""
-        if force_update or self._channels is None:
-            raw_list = await self.gate.exec_paged_req(api.Channel.list(guild_id=self.id))
-            channels: List[PublicChannel] = []
-            channel_categories: Dict[str, ChannelCategory] = {}
-            for i in raw_list:
-                if i['is_category']:
-                    cc = ChannelCategory(_gate_=self.gate, _guild_id_=self.id, **i)
-                    channel_categories[cc.id] = cc
-                else:
-                    channels.append(public_channel_factory(_gate_=self.gate, **i))
-
-            self._channels = []
-            for i in channels:
-                if i.parent_id in channel_categories:
-                    channel_categories[i.parent_id].append(i)
-                else:
-                    self._channels.append(i)
-            self._channel_categories = channel_categories
+    @swr_cache()
+    async def fetch_channel_list(self) -> List[PublicChannel]:
+        """fetch channel list from khl server, cached, pass ``force_update=True`` to skip the cache"""
+        raw_list = await coalesce(self._req_ident('channels'),
+                                  lambda: self.gate.exec_paged_req_concurrent(api.Channel.list(guild_id=self.id)))
+        channels: List[PublicChannel] = []
+        channel_categories: Dict[str, ChannelCategory] = {}
+        for i in raw_list:
+            if i['is_category']:
+                cc = ChannelCategory(_gate_=self.gate, _guild_id_=self.id, **i)
+                channel_categories[cc.id] = cc
+            else:
+                channels.append(public_channel_factory(_gate_=self.gate, **i))
+
+        self._channels = []
+        for i in channels:
+            if i.parent_id in channel_categories:
+                channel_categories[i.parent_id].append(i)
+            else:
+                self._channels.append(i)
+        self._channel_categories = channel_categories
         return self._merge_channels()
 
+    async def iter_channels(self) -> AsyncIterator[PublicChannel]:
+        """iterate channels(categories excluded) in the guild, page by page
+
+        not cached, for lookups such as "find the first voice channel", break early to skip the rest pages"""
+        async for i in self.gate.iter_paged_req(api.Channel.list(guild_id=self.id)):
+            if not i['is_category']:
+                yield public_channel_factory(_gate_=self.gate, **i)
+
     def _merge_channels(self) -> List[PublicChannel]:
         channels = []
         channels.extend(self._channels)
@@ -250,13 +278,22 @@ class Guild(LazyLoadable, Requestable):
         """list users in the guild/a channel belongs to the guild
 
         paged req, support standard pagination args"""
-        cid = channel.id if isinstance(channel, Channel) else channel
-        params = {'guild_id': self.id}
-        if cid is not None:
-            params['channel_id'] = cid
-        users = await self.gate.exec_paged_req(api.Guild.userList(**params), **kwargs)
+        users = await self.gate.exec_paged_req_concurrent(self._user_list_req(channel), **kwargs)
         return [User(_gate_=self.gate, _lazy_loaded_=True, **i) for i in users]
 
+    async def iter_users(self, channel: Union[Channel, str] = None, **kwargs) -> AsyncIterator[User]:
+        """iterate users in the guild/a channel belongs to the guild, page by page
+
+        paged req, support standard pagination args, break early to skip the rest pages"""
+        async for i in self.gate.iter_paged_req(self._user_list_req(channel), **kwargs):
+            yield User(_gate_=self.gate, _lazy_loaded_=True, **i)
+
+    def _user_list_req(self, channel: Union[Channel, str, None]):
+        params = {'guild_id': self.id}
+        if channel is not None:
+            params['channel_id'] = unpack_id(channel)
+        return api.Guild.userList(**params)
+
     async def fetch_joined_channel(self,
                                    user: Union[User, str],
                                    page: int = 1,
@@ -276,26 +313,33 @@ class Guild(LazyLoadable, Requestable):
         """set the user's nickname in this guild"""
         await self.gate.exec_req(api.Guild.nickname(guild_id=self.id, nickname=nickname, user_id=unpack_id(user)))
 
-    async def fetch_roles(self, force_update: bool = True) -> List[Role]:
-        """fetch the role list in the guild"""
-        if force_update or self._roles is None:
-            raw_list = await self.gate.exec_paged_req(api.GuildRole.list(guild_id=self.id))
-            self._roles = [Role(**i) for i in raw_list]
+    @swr_cache()
+    async def fetch_roles(self) -> List[Role]:
+        """fetch the role list in the guild, cached, pass ``force_update=True`` to skip the cache"""
+        raw_list = await coalesce(self._req_ident('roles'),
+                                  lambda: self.gate.exec_paged_req_concurrent(api.GuildRole.list(guild_id=self.id)))
+        self._roles = list(map(Role.from_dict, raw_list))
         return self._roles
 
     async def create_role(self, role_name: str) -> Role:
         """create a role in the guild"""
-        return Role(**(await self.gate.exec_req(api.GuildRole.create(guild_id=self.id, name=role_name))))
+        rt = Role(**(await self.gate.exec_req(api.GuildRole.create(guild_id=self.id, name=role_name))))
+        self._invalidate('fetch_roles', 'roles')
+        return rt
 
     async def update_role(self, new_role: Role) -> Role:
         """update a role in the guild
 
         :param new_role an edited role object"""
-        return Role(**(await self.gate.exec_req(api.GuildRole.update(guild_id=self.id, **vars(new_role)))))
+        rt = Role(**(await self.gate.exec_req(api.GuildRole.update(guild_id=self.id, **vars(new_role)))))
+        self._invalidate('fetch_roles', 'roles')
+        return rt
 
     async def delete_role(self, role: Union[int, Role]):
         """delete a role from the guild"""
-        return await self.gate.exec_req(api.GuildRole.delete(guild_id=self.id, role_id=unpack_id(role)))
+        rt = await self.gate.exec_req(api.GuildRole.delete(guild_id=self.id, role_id=unpack_id(role)))
+        self._invalidate('fetch_roles', 'roles')
+        return rt
 
     async def grant_role(self, user: Union[User, str], role: Union[Role, int]):
         """
@@ -313,6 +357,38 @@ class Guild(LazyLoadable, Requestable):
         return await self.gate.exec_req(
             api.GuildRole.revoke(guild_id=self.id, user_id=unpack_id(user), role_id=unpack_id(role)))
 
+    async def grant_roles_bulk(self,
+                               pairs: Iterable[Tuple[Union[User, str], Union[Role, int]]],
+                               concurrency: int = 10) -> List:
+        """grant roles to users concurrently, at most ``concurrency`` reqs in flight
+
+        :param pairs: (user, role) pairs
+        :return: results of each grant, in the same order as ``pairs``; a failed grant does not stop the others,
+            its exception is placed in the list as its result"""
+        return await self._exec_role_bulk(self.grant_role, pairs, concurrency)
+
+    async def revoke_roles_bulk(self,
+                                pairs: Iterable[Tuple[Union[User, str], Union[Role, int]]],
+                                concurrency: int = 10) -> List:
+        """revoke roles from users concurrently, at most ``concurrency`` reqs in flight
+
+        :param pairs: (user, role) pairs
+        :return: results of each revoke, in the same order as ``pairs``; a failed revoke does not stop the others,
+            its exception is placed in the list as its result"""
+        return await self._exec_role_bulk(self.revoke_role, pairs, concurrency)
+
+    @staticmethod
+    async def _exec_role_bulk(func: Callable[..., Coroutine], pairs, concurrency: int) -> List:
+        if concurrency < 1:
+            raise ValueError(f'concurrency should be at least 1, got {concurrency}')
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(user, role):
+            async with sem:
+                return await func(user, role)
+
+        return await asyncio.gather(*(one(u, r) for u, r in pairs), return_exceptions=True)
+
     async def create_text_channel(self, name: str, category: Union[str, ChannelCategory] = None) -> PublicTextChannel:
         """create a text channel in the guild
 
@@ -320,7 +396,9 @@ class Guild(LazyLoadable, Requestable):
         params = {'name': name, 'guild_id': self.id, 'type': ChannelTypes.TEXT.value}
         if category:
             params['parent_id'] = unpack_id(category)
-        return public_channel_factory(self.gate, **(await self.gate.exec_req(api.Channel.create(**params))))
+        rt = public_channel_factory(self.gate, **(await self.gate.exec_req(api.Channel.create(**params))))
+        self._invalidate('fetch_channel_list', 'channels')
+        return rt
 
     async def create_voice_channel(self,
                                    name: str,
@@ -337,18 +415,24 @@ class Guild(LazyLoadable, Requestable):
             params['limit_amount'] = limit_amount
         if voice_quality:
             params['voice_quality'] = voice_quality
-        return public_channel_factory(self.gate, **(await self.gate.exec_req(api.Channel.create(**params))))
+        rt = public_channel_factory(self.gate, **(await self.gate.exec_req(api.Channel.create(**params))))
+        self._invalidate('fetch_channel_list', 'channels')
+        return rt
 
     async def create_channel_category(self, name: str) -> ChannelCategory:
         """create a channel category in the guild
 
         docs: https://developer.kaiheila.cn/doc/http/channel#%E5%88%9B%E5%BB%BA%E9%A2%91%E9%81%93"""
         params = {'guild_id': self.id, 'name': name, 'is_category': 1}
-        return ChannelCategory(_gate_=self.gate, **(await self.gate.exec_req(api.Channel.create(**params))))
+        rt = ChannelCategory(_gate_=self.gate, **(await self.gate.exec_req(api.Channel.create(**params))))
+        self._invalidate('fetch_channel_list', 'channels')
+        return rt
 
     async def delete_channel(self, channel: Union[Channel, str]):
         """delete the channel from the guild"""
-        return await self.gate.exec_req(api.Channel.delete(unpack_id(channel)))
+        rt = await self.gate.exec_req(api.Channel.delete(unpack_id(channel)))
+        self._invalidate('fetch_channel_list', 'channels')
+        return rt
 
     async def kickout(self, user: Union[User, str]):
         """kick the user from the guild"""
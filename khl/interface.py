@@ -36,6 +36,7 @@ class LazyLoadable(ABC):
         `Channel`: we usually construct a channel with a message for convenient,
         while we only know the channel's id, so this channel is not `loaded`, until call the `load()`
     """
+    __slots__ = ()
     _loaded: bool
 
     @abstractmethod
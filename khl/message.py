@@ -1,7 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Union, Optional
-
-import json
+from typing import Any, List, Dict, Union, Optional, FrozenSet
 
 from . import api
 from .channel import PublicTextChannel, PrivateChannel
@@ -10,6 +8,7 @@ from .gateway import Requestable
 from .guild import Guild
 from ._types import MessageTypes, ChannelPrivacyTypes, EventTypes
 from .user import User, GuildUser
+from .util import dump_card, intern_id
 
 
 class QuotedMessage(Requestable, ABC):
@@ -78,6 +77,9 @@ class RawMessage(ABC):
         1. Message (sent by users, those normal chats such as TEXT/IMG etc.)
         2. Event (sent by system, such as notifications and broadcasts)
     """
+    __slots__ = ('_msg_id', '_type', '_channel_type', 'target_id', 'author_id', 'content', 'msg_timestamp', 'nonce',
+                 'extra', '_type_enum', '_channel_type_enum')
+    _is_public = False  # class-level flag, cheaper than isinstance(msg, PublicMessage) in hot checks
 
     _type: int
     _channel_type: str
@@ -93,12 +95,15 @@ class RawMessage(ABC):
         self._msg_id = kwargs.get('msg_id')
         self._type = kwargs.get('type')
         self._channel_type = kwargs.get('channel_type')
-        self.target_id = kwargs.get('target_id')
-        self.author_id = kwargs.get('author_id')
+        self.target_id = intern_id(kwargs.get('target_id'))
+        self.author_id = intern_id(kwargs.get('author_id'))
         self.content = kwargs.get('content')
         self.msg_timestamp = kwargs.get('msg_timestamp')
         self.nonce = kwargs.get('nonce')
         self.extra = kwargs.get('extra', {})
+        # enum lookups are resolved on first access, then reused
+        self._type_enum = None
+        self._channel_type_enum = None
 
     @property
     def id(self) -> str:
@@ -108,12 +113,16 @@ class RawMessage(ABC):
     @property
     def type(self) -> MessageTypes:
         """message's type, refer to MessageTypes for enum detail"""
-        return MessageTypes(self._type)
+        if self._type_enum is None:
+            self._type_enum = MessageTypes(self._type)
+        return self._type_enum
 
     @property
     def channel_type(self) -> ChannelPrivacyTypes:
         """type of the channel where the message in"""
-        return ChannelPrivacyTypes(self._channel_type)
+        if self._channel_type_enum is None:
+            self._channel_type_enum = ChannelPrivacyTypes(self._channel_type)
+        return self._channel_type_enum
 
 
 class Message(RawMessage, Requestable, ABC):
@@ -126,6 +135,7 @@ class Message(RawMessage, Requestable, ABC):
         1. ChannelMessage: sent in a guild channel
         2. PrivateMessage: sent in a private chat
     """
+    __slots__ = ('gate', '_ctx', '_author', '_quote')
     _ctx: Context
     _author: User
     _quote: Optional[QuotedMessage]
@@ -133,6 +143,10 @@ class Message(RawMessage, Requestable, ABC):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.gate = kwargs.get('_gate_', None)
+        # built on first access by subclasses, most handlers never touch them
+        self._ctx = None
+        self._author = None
+        self._quote = None
 
     @property
     def author(self) -> User:
@@ -179,6 +193,8 @@ class Message(RawMessage, Requestable, ABC):
     @abstractmethod
     async def update(self, content: Union[str, List], quote: str = None, temp_target_id: str = None):
         """Update the message content, the type of content should be same the original type of the message
+
+        when updating many messages with the same card, pass ``dump_card(card)`` to serialize it only once
         https://developer.kookapp.cn/doc/http/message#%E6%9B%B4%E6%96%B0%E9%A2%91%E9%81%93%E8%81%8A%E5%A4%A9%E6%B6%88%E6%81%AF
         https://developer.kookapp.cn/doc/http/direct-message#%E6%9B%B4%E6%96%B0%E7%A7%81%E4%BF%A1%E8%81%8A%E5%A4%A9%E6%B6%88%E6%81%AF
         :param content: updated content, its type should be same as the original type
@@ -209,23 +225,31 @@ class PublicMessage(Message):
     """
     Messages sent in a `PublicTextChannel`
     """
+    __slots__ = ('_mention', '_mention_roles')
+    _is_public = True
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        channel = PublicTextChannel(id=self.target_id, name=self.extra['channel_name'], _gate_=self.gate)
-        guild = Guild(id=self.extra['guild_id'], _gate_=self.gate)
-        self._ctx = Context(channel=channel, guild=guild, _gate_=self.gate)
-        self._author = GuildUser(**self.extra['author'], _gate_=self.gate, _lazy_loaded_=True)
-        if 'quote' in self.extra:
-            self._quote = PublicQuotedMessage(**self.extra['quote'], _gate_=self.gate, _lazy_loaded_=True)
-        else:
-            self._quote = None
+        # sets: rules check `id in msg.mention` many times per message
+        self._mention = frozenset(self.extra.get('mention', ()))
+        self._mention_roles = frozenset(self.extra.get('mention_roles', ()))
 
     @property
     def author(self) -> GuildUser:
         """message author"""
+        if self._author is None:
+            self._author = GuildUser(**self.extra['author'], _gate_=self.gate, _lazy_loaded_=True)
         return self._author
 
+    @property
+    def ctx(self) -> Context:
+        """message context: channel, guild etc."""
+        if self._ctx is None:
+            channel = PublicTextChannel(id=self.target_id, name=self.extra['channel_name'], _gate_=self.gate)
+            guild = Guild(id=self.extra['guild_id'], _gate_=self.gate)
+            self._ctx = Context(channel=channel, guild=guild, _gate_=self.gate)
+        return self._ctx
+
     @property
     def guild(self) -> Guild:
         """the guild where the message in"""
@@ -239,9 +263,9 @@ class PublicMessage(Message):
         raise ValueError('PublicMessage should be placed in PublicTextChannel')
 
     @property
-    def mention(self) -> List[str]:
+    def mention(self) -> FrozenSet[str]:
         """the message mentioned(also call as at/tagged) users' id"""
-        return self.extra['mention']
+        return self._mention
 
     @property
     def mention_all(self) -> bool:
@@ -249,9 +273,9 @@ class PublicMessage(Message):
         return self.extra['mention_all']
 
     @property
-    def mention_roles(self) -> List:
+    def mention_roles(self) -> FrozenSet:
         """the message mentioned(also call as at/tagged) roles' id"""
-        return self.extra['mention_roles']
+        return self._mention_roles
 
     @property
     def mention_here(self) -> bool:
@@ -265,6 +289,8 @@ class PublicMessage(Message):
 
         If the quote does not exist, it will return None
         """
+        if self._quote is None and self.extra.get('quote'):
+            self._quote = PublicQuotedMessage(**self.extra['quote'], _gate_=self.gate, _lazy_loaded_=True)
         return self._quote
 
     async def add_reaction(self, emoji: str):
@@ -275,8 +301,8 @@ class PublicMessage(Message):
         return await self.gate.exec_req(req)
 
     async def update(self, content: Union[str, List], quote: str = None, temp_target_id: str = None):
-        if isinstance(content, List):
-            content = json.dumps(content)
+        if isinstance(content, list):
+            content = dump_card(content)
         params = {'msg_id': self.id, 'content': content}
         if quote is not None:
             params['quote'] = quote
@@ -302,16 +328,22 @@ class PrivateMessage(Message):
     """
     Messages sent in a `PrivateChannel`
     """
+    __slots__ = ()
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self._channel = PrivateChannel(code=self.extra['code'], target_info=self.extra['author'], _gate_=self.gate)
-        self._ctx = Context(channel=self._channel, _gate_=self.gate)
-        self._author = User(**self.extra['author'], _gate_=self.gate, _lazy_loaded_=True)
-        if 'quote' in self.extra:
-            self._quote = PrivateQuotedMessage(**self.extra['quote'], _gate_=self.gate, _lazy_loaded_=True)
-        else:
-            self._quote = None
+    @property
+    def author(self) -> User:
+        """message author"""
+        if self._author is None:
+            self._author = User(**self.extra['author'], _gate_=self.gate, _lazy_loaded_=True)
+        return self._author
+
+    @property
+    def ctx(self) -> Context:
+        """message context: channel, guild etc."""
+        if self._ctx is None:
+            channel = PrivateChannel(code=self.extra['code'], target_info=self.extra['author'], _gate_=self.gate)
+            self._ctx = Context(channel=channel, _gate_=self.gate)
+        return self._ctx
 
     @property
     def chat_code(self) -> str:
@@ -321,7 +353,7 @@ class PrivateMessage(Message):
     @property
     def channel(self) -> PrivateChannel:
         """the message's channel"""
-        return self._channel
+        return self.ctx.channel
 
     @property
     def quote(self) -> PrivateQuotedMessage:
@@ -330,6 +362,8 @@ class PrivateMessage(Message):
 
         If the quote does not exist, it will return None
         """
+        if self._quote is None and self.extra.get('quote'):
+            self._quote = PrivateQuotedMessage(**self.extra['quote'], _gate_=self.gate, _lazy_loaded_=True)
         return self._quote
 
     async def add_reaction(self, emoji: str):
@@ -340,8 +374,8 @@ class PrivateMessage(Message):
         return await self.gate.exec_req(req)
 
     async def update(self, content: Union[str, List], quote: str = None, _: str = None):
-        if isinstance(content, List):
-            content = json.dumps(content)
+        if isinstance(content, list):
+            content = dump_card(content)
         params = {'msg_id': self.id, 'content': content}
         if quote is not None:
             params['quote'] = quote
@@ -350,11 +384,18 @@ class PrivateMessage(Message):
 
 class Event(RawMessage):
     """sent by system, opposites to Message, carries various types of payload"""
+    __slots__ = ('_event_type',)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._event_type = None
 
     @property
     def event_type(self) -> EventTypes:
         """type of the event, refer to EventTypes for enum detail"""
-        return EventTypes(self.extra['type'])
+        if self._event_type is None:
+            self._event_type = EventTypes(self.extra['type'])
+        return self._event_type
 
     @property
     def body(self) -> Dict:
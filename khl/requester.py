@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Union, List, Optional
+from typing import Union, List, Optional, AsyncIterator
 
 from aiohttp import ClientSession
 
@@ -99,6 +99,76 @@ class HTTPRequester:
 
         return ret
 
+    async def exec_paged_req_concurrent(self,
+                                        r: _Req,
+                                        *,
+                                        begin_page: int = 1,
+                                        end_page: int = None,
+                                        page_size: int = 50,
+                                        sort: str = '',
+                                        concurrency: int = 5) -> List:
+        """
+        execute paged requests concurrently
+
+        same params and result as ``exec_paged_req()``, but only ``begin_page`` is requested alone(to learn the
+        ``page_total``), the rest pages are requested at the same time, at most ``concurrency`` reqs in flight
+
+        :param concurrency: int = 5, cap of in-flight reqs, keep it low to get along with the ratelimiter
+        """
+        if concurrency < 1:
+            raise ValueError(f'concurrency should be at least 1, got {concurrency}')
+        if end_page is not None and begin_page > end_page:
+            return []  # same as exec_paged_req(): no page in range, no req
+
+        p = await self.exec_req(self._page_req(r, begin_page, page_size, sort))
+        ret = list(p['items'])
+        page_size = p['meta']['page_size']
+        if end_page is None:
+            end_page = p['meta']['page_total']
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(page: int) -> List:
+            async with sem:
+                return (await self.exec_req(self._page_req(r, page, page_size, sort)))['items']
+
+        pages = await asyncio.gather(*(fetch_page(i) for i in range(p['meta']['page'] + 1, end_page + 1)))
+        for items in pages:
+            ret.extend(items)
+        return ret
+
+    async def iter_paged_req(self,
+                             r: _Req,
+                             *,
+                             begin_page: int = 1,
+                             end_page: int = None,
+                             page_size: int = 50,
+                             sort: str = '') -> AsyncIterator:
+        """
+        execute paged requests lazily, yield items page by page
+
+        same params as ``exec_paged_req()``, but the next page is requested only after items of the current page are
+        consumed, so breaking out of ``async for`` early saves the reqs of the rest pages
+        """
+        current_page = begin_page
+        while end_page is None or current_page <= end_page:
+            p = await self.exec_req(self._page_req(r, current_page, page_size, sort))
+            for item in p['items']:
+                yield item
+
+            current_page = p['meta']['page'] + 1
+            page_size = p['meta']['page_size']
+            if end_page is None:
+                end_page = p['meta']['page_total']
+
+    @staticmethod
+    def _page_req(r: _Req, page: int, page_size: int, sort: str) -> _Req:
+        """copy ``r`` with pagination params filled, reqs in flight at the same time can not share one params dict"""
+        params = dict(r.params['params'], page=page, page_size=page_size)
+        if sort:
+            params['sort'] = sort
+        return _Req(r.method, r.route, {**r.params, 'params': params})
+
     class APIRequestFailed(Exception):
         """Raised when khl.py received non-zero error code from remote server.
 
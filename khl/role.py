@@ -17,14 +17,24 @@ class Role:
     type: RoleTypes
 
     def __init__(self, **kwargs):
-        self.role_id: int = kwargs.get("role_id", 0)
-        self.name: str = kwargs.get("name", "")
-        self.color: int = kwargs.get("color", 0)
-        self.position: int = kwargs.get("position", 0)
-        self.hoist: int = kwargs.get("hoist", 0)
-        self.mentionable: int = kwargs.get("mentionable", 0)
-        self.permissions: int = kwargs.get("permissions", 0)
-        self.type: RoleTypes = RoleTypes(kwargs.get("type", 0))
+        self._update_fields(kwargs)
+
+    @classmethod
+    def from_dict(cls, d: dict) -> 'Role':
+        """construct from a raw role dict, skips the ``**kwargs`` unpacking of ``Role(**d)``"""
+        role = cls.__new__(cls)
+        role._update_fields(d)
+        return role
+
+    def _update_fields(self, d: dict):
+        self.role_id: int = d.get("role_id", 0)
+        self.name: str = d.get("name", "")
+        self.color: int = d.get("color", 0)
+        self.position: int = d.get("position", 0)
+        self.hoist: int = d.get("hoist", 0)
+        self.mentionable: int = d.get("mentionable", 0)
+        self.permissions: int = d.get("permissions", 0)
+        self.type: RoleTypes = RoleTypes(d.get("type", 0))
 
     @property
     def id(self) -> int:
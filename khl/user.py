@@ -1,4 +1,3 @@
-import json
 from typing import List, Union
 
 from . import api
@@ -7,6 +6,7 @@ from .gateway import Requestable, Gateway
 from .interface import LazyLoadable
 from .intimacy import Intimacy
 from .role import Role
+from .util import dump_card
 
 
 class User(LazyLoadable, Requestable):
@@ -57,9 +57,9 @@ class User(LazyLoadable, Requestable):
         ``temp_target_id`` is only available in ChannelPrivacyTypes.GROUP
         """
         # if content is card msg, then convert it to plain str
-        if isinstance(content, List):
+        if isinstance(content, list):
             type = MessageTypes.CARD
-            content = json.dumps(content)
+            content = dump_card(content)
         else:
             type = type or MessageTypes.KMD
 
@@ -124,11 +124,7 @@ class GuildUser(User):
         :return: A list for Role
         """
         guild_roles = (await self.gate.exec_paged_req(api.GuildRole.list(self.guild_id), **kwargs))
-        rt: List[Role] = []
-        for role in guild_roles:
-            if role['role_id'] in self.roles:
-                rt.append(Role(**role))
-        return rt
+        return [Role.from_dict(role) for role in guild_roles if role['role_id'] in self.roles]
 
     async def set_nickname(self, nickname: str):
         """
@@ -1,4 +1,14 @@
 """common hax"""
+import asyncio
+import json
+import logging
+import sys
+import time
+from typing import Awaitable, Callable, Dict
+
+log = logging.getLogger(__name__)
+
+_in_flight: Dict[str, asyncio.Future] = {}
 
 
 def unpack_id(obj):
@@ -9,3 +19,112 @@ def unpack_id(obj):
 def unpack_value(enum):
     """extract enum's value if not basic data type"""
     return enum if isinstance(enum, (str, int)) else enum.value
+
+
+def intern_id(value):
+    """``sys.intern()`` str ids, which repeat across many objects, so copies share memory and compare by pointer"""
+    return sys.intern(value) if type(value) is str else value  # pylint: disable=unidiomatic-typecheck
+
+
+def dump_card(content: list) -> str:
+    """serialize card message content into the compact JSON str that khl server accepts"""
+    return json.dumps(content, separators=(',', ':'))
+
+
+async def coalesce(ident: str, coro_func: Callable[[], Awaitable]):
+    """
+    await ``coro_func()``, concurrent calls with the same ``ident`` share one run and get the same result
+
+    CAUTION: the result is shared, callers should not mutate it; and ``ident`` is process-wide, so scope it to
+    everything the result depends on, such as the gateway(thus the token) it is requested with
+    """
+    fut = _in_flight.get(ident)
+    if fut is None:
+        fut = asyncio.ensure_future(coro_func())
+        _in_flight[ident] = fut
+        fut.add_done_callback(lambda f: _in_flight.pop(ident) if _in_flight.get(ident) is f else None)
+    # shield: a cancelled caller should not cancel the run shared with others
+    return await asyncio.shield(fut)
+
+
+def forget_in_flight(ident: str):
+    """later ``coalesce()`` calls on ``ident`` start a new run, e.g. after a mutation outdated the run in flight"""
+    _in_flight.pop(ident, None)
+
+
+def swr_cache(ttl: float = 60, stale: float = 600):
+    """
+    stale-while-revalidate cache for async methods, results are stored in ``self._cache`` keyed by method name
+
+    the decorated method takes no args, and gains a ``force_update`` param:
+        1. fresh(younger than ``ttl`` secs): return the cached result
+        2. stale(younger than ``stale`` secs): return the cached result, and refresh it in background
+        3. missing, expired or ``force_update=True``: await the method and cache its result
+
+    after a mutation, call ``swr_invalidate(self, method_name)`` to drop the result
+    """
+
+    # pylint: disable=protected-access
+    # entry: [timestamp or None if invalidated, result, background refresh task, generation]
+    def decorator(func):
+        key = func.__name__
+
+        async def refresh(self):
+            entry = self._cache.get(key)
+            gen = entry[3] if entry else 0
+            rt = await func(self)
+            entry = self._cache.get(key)
+            # an invalidation during the await bumps the generation, the result read before it is outdated
+            if (entry[3] if entry else 0) == gen:
+                self._cache[key] = [time.monotonic(), rt, None, gen]
+            return rt
+
+        async def refresh_safe(self):
+            try:
+                await refresh(self)
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                log.exception(f'error raised during background refresh of {key}', exc_info=e)
+                entry = self._cache.get(key)
+                if entry is not None:
+                    entry[2] = None
+
+        async def wrapper(self, force_update: bool = False):
+            entry = self._cache.get(key)
+            if force_update or entry is None or entry[0] is None or time.monotonic() - entry[0] > stale:
+                return await refresh(self)
+            if time.monotonic() - entry[0] > ttl and entry[2] is None:
+                entry[2] = asyncio.ensure_future(refresh_safe(self))
+            return entry[1]
+
+        # not functools.wraps(): it would also copy __wrapped__, hiding the ``force_update`` param from inspection
+        wrapper.__name__, wrapper.__qualname__, wrapper.__doc__ = func.__name__, func.__qualname__, func.__doc__
+        return wrapper
+
+    return decorator
+
+
+def swr_invalidate(obj, key: str):
+    """drop the result cached by ``@swr_cache`` method ``key`` of ``obj``, refreshes in flight will not write back"""
+    entry = obj._cache.get(key)  # pylint: disable=protected-access
+    if entry is not None and entry[2] is not None:
+        entry[2].cancel()
+    obj._cache[key] = [None, None, None, (entry[3] if entry else 0) + 1]  # pylint: disable=protected-access
+
+
+def install_uvloop() -> bool:
+    """
+    use uvloop(``pip install uvloop``), a faster drop-in event loop, if it is installed
+
+    call it before ``Bot()`` is constructed, then ``Bot.run()`` will create its loop from uvloop.
+    CAUTION: requires python >= 3.10, older asyncio binds primitives that khl.py creates at import to the default loop
+
+    :return: if uvloop is applied
+    """
+    try:
+        import uvloop  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True